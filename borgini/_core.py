@@ -4,26 +4,77 @@ borgini._core
 """
 from __future__ import annotations
 
+import contextlib
 import datetime
+import functools
 import os
 import pathlib
+import re
 import shutil
 import subprocess
 import typing as t
 
-from pygments import highlight
-from pygments.formatters.terminal256 import Terminal256Formatter
-
-# noinspection PyUnresolvedReferences
-from pygments.lexers.configs import IniLexer
-
-# noinspection PyUnresolvedReferences
-from pygments.lexers.shell import BashLexer
+if t.TYPE_CHECKING:
+    from pygments.formatters.terminal256 import Terminal256Formatter
+    from pygments.lexer import Lexer
 
 HOME = str(pathlib.Path.home())
 EXCLUDE = "exclude"
 INCLUDE = "include"
 
+_LINE_RE = re.compile(r"^[ \t]*([^#\r\n]*?)[ \t\r]*(?:#[^\n]*)?$")
+_PATTERN_STYLE_RE = re.compile(r"^[a-z]{2}:")
+_STYLE_RE = re.compile(r'^[ \t]*[^#\s][^=\n]*=[ \t]*"?([^"\n]+?)"?[ \t\r]*$')
+
+
+def _now() -> datetime.datetime:
+    # looked up through this module so the clock can be frozen without
+    # patching the global ``datetime`` module
+    return datetime.datetime.now()
+
+
+@functools.lru_cache(maxsize=None)
+def which(exe: str) -> str | None:
+    """Cached ``shutil.which`` as ``PATH`` won't change within a run.
+
+    :param exe: Executable to find.
+    :return: Path to the executable or ``None``.
+    """
+    return shutil.which(exe)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lexer(ini: bool) -> Lexer:
+    # ``pygments`` is only imported once there is something to highlight
+    # pylint: disable=import-outside-toplevel
+    if ini:
+        # noinspection PyUnresolvedReferences
+        from pygments.lexers.configs import IniLexer
+
+        return IniLexer()
+
+    # noinspection PyUnresolvedReferences
+    from pygments.lexers.shell import BashLexer
+
+    return BashLexer()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_formatter(style: str) -> Terminal256Formatter:
+    # pylint: disable=import-outside-toplevel
+    from pygments.formatters.terminal256 import Terminal256Formatter
+
+    return Terminal256Formatter(style=style)
+
+
+class Files(t.NamedTuple):
+    """Paths to the files belonging to a profile."""
+
+    config_ini: str
+    include: str
+    exclude: str
+    styles: str
+
 
 class BorgBackup:
     """``Borgbackup`` wrapper class.
@@ -45,31 +96,33 @@ class BorgBackup:
     ) -> None:
         self.repo = f"{repopath}/{args[0]}"
         self.pygments = pygments
-        self.bin = shutil.which("borg")
+        self.bin = which("borg")
         self.dry = dry if self.bin else True
-        self.date = datetime.datetime.now().strftime(args[1])
+        self.date = _now().strftime(args[1])
         self.archive = f"{self.repo}::{args[0]}-{self.date}"
 
     @staticmethod
     def _separate_keep(
-        args: t.List[str],
-    ) -> t.Tuple[t.Tuple[t.Any, ...], t.Tuple[str, ...]]:
-        keep = [
-            args.pop(args.index(a))
-            for a in list(args)
-            if a.startswith("--keep-")
-        ]
-        return tuple(args), tuple(keep)
-
-    def _run_borg(self, args: t.Tuple[str, ...]) -> None:
+        args: t.Sequence[t.Tuple[str, ...]]
+    ) -> t.Tuple[
+        t.Tuple[t.Tuple[str, ...], ...], t.Tuple[t.Tuple[str, ...], ...]
+    ]:
+        keep: t.List[t.Tuple[str, ...]] = []
+        rest: t.List[t.Tuple[str, ...]] = []
+        for arg in args:
+            (keep if arg[0].startswith("--keep-") else rest).append(arg)
+
+        return tuple(rest), tuple(keep)
+
+    def _run_borg(self, args: t.Sequence[str]) -> None:
         subprocess.call([str(self.bin), *args])
 
-    def _dry_mode(self, args: t.Tuple[str, ...]) -> None:
+    def _dry_mode(self, args: t.Sequence[str]) -> None:
         borgargs = " ".join([f" {a}\n" for a in args])
         borg = self.bin if self.bin else "borg"
         self.pygments.print(f"\n{borg} {borgargs[1:-1]}", ini=False)
 
-    def borg(self, *args: str) -> None:
+    def borg(self, argv: t.Sequence[str], display: t.Sequence[str]) -> None:
         """Run ``borgbackup``.
 
         Run ``create`` to create a backup or ``prune`` to prune an old
@@ -79,18 +132,20 @@ class BorgBackup:
         display the command that would occur - this won't run a backup
         or prune.
 
-        :param args: Arguments for the borg command to receive, parsed
+        :param argv: Arguments for the borg command to receive, parsed
             from the ``config.ini``, the ``include`` and the ``exclude``
-            files
+            files - every option, value and path is its own item.
+        :param display: The same arguments formatted as they would be
+            displayed on the commandline.
         """
         if self.dry:
-            self._dry_mode(args)
+            self._dry_mode(display)
         else:
-            self._run_borg(args)
+            self._run_borg(argv)
 
     def create(
         self,
-        args: t.Tuple[str, ...],
+        args: t.Tuple[t.Tuple[str, ...], ...],
         exclude: t.Tuple[str, ...],
         include: t.Tuple[str, ...],
     ) -> None:
@@ -109,9 +164,24 @@ class BorgBackup:
             ``include`` list - files and dirs will be overridden by
             exclude.
         """
-        self.borg("create", *args, *exclude, f"{self.archive}", *include)
-
-    def prune(self, args: t.Tuple[str, ...]) -> None:
+        self.borg(
+            [
+                "create",
+                *(a for arg in args for a in arg),
+                *(a for path in exclude for a in ("--exclude", path)),
+                self.archive,
+                *include,
+            ],
+            [
+                "create",
+                *(" ".join(arg) for arg in args),
+                *(f"--exclude '{path}'" for path in exclude),
+                self.archive,
+                *(f"'{path}'" for path in include),
+            ],
+        )
+
+    def prune(self, args: t.Tuple[t.Tuple[str, ...], ...]) -> None:
         """Run the ``borg prune`` command.
 
         Includes several miscellaneous boolean arguments that can be
@@ -121,8 +191,12 @@ class BorgBackup:
             shown, the command is verbose etc.
         """
 
-        pruneargs, keep = self._separate_keep(list(args))
-        self.borg("prune", *pruneargs, f"{self.repo}", *keep)
+        pruneargs, keep = self._separate_keep(args)
+        groups = (("prune",), *pruneargs, (self.repo,), *keep)
+        self.borg(
+            [a for arg in groups for a in arg],
+            [" ".join(arg) for arg in groups],
+        )
 
 
 class Data:
@@ -137,19 +211,16 @@ class Data:
 
     def __init__(self, appdir: str, profile: str) -> None:
         self.dirname = os.path.join(appdir, profile)
-        self.files = self._get_file_obj()
-
-    def _get_file_obj(self) -> t.Dict[str, str]:
-        paths = "config.ini", INCLUDE, EXCLUDE, "styles"
-        return {p: os.path.join(self.dirname, p) for p in paths}
+        self.files = Files(
+            *(
+                os.path.join(self.dirname, p)
+                for p in ("config.ini", INCLUDE, EXCLUDE, "styles")
+            )
+        )
 
     def make_appdir(self) -> None:
         """Create the config directory for all the user's settings."""
-        if not os.path.isdir(self.dirname):
-            os.makedirs(self.dirname)
-
-    def _get_paths(self, *args: str) -> t.Tuple[str, ...]:
-        return tuple(self.files[arg] for arg in args)
+        os.makedirs(self.dirname, exist_ok=True)
 
     def initialize_data_files(
         self,
@@ -165,28 +236,30 @@ class Data:
         :param pathlists: Tuple containing two tuples of lines to write
             to file.
         """
+        with os.scandir(self.dirname) as entries:
+            existing = {e.name for e in entries}
+
         for count, datafile in enumerate(
-            self._get_paths(INCLUDE, EXCLUDE, "styles")
+            (self.files.include, self.files.exclude, self.files.styles)
         ):
-            if not os.path.isfile(datafile):
-                with open(datafile, "w", encoding="utf-8") as file:
-                    for path in pathlists[count]:
-                        file.write(f"{path}\n")
+            if os.path.basename(datafile) in existing:
+                continue
+
+            # another process may have created the file since the scan
+            with contextlib.suppress(FileExistsError), open(
+                datafile, "x", encoding="utf-8"
+            ) as file:
+                file.write("\n".join(pathlists[count]) + "\n")
 
     @staticmethod
-    def _read_datafile(path: str) -> t.List[str]:
+    def _iter_entries(path: str) -> t.Iterator[str]:
         with open(path, encoding="utf-8") as file:
-            readfile = file.read().strip()
-
-        return readfile.splitlines()
-
-    def _parse_datafile(self, path: str) -> t.List[str]:
-        files = self._read_datafile(path)
-
-        # remove string starting at the hash symbol if inline
-        # comment or remove entire line if the first index is the
-        # hash symbol
-        return [f"'{f.split('#')[0].strip()}'" for f in files if f[0] != "#"]
+            for line in file:
+                # remove string starting at the hash symbol if inline
+                # comment or skip entire line if it is empty or commented
+                match = _LINE_RE.match(line)
+                if match and match.group(1):
+                    yield match.group(1)
 
     def get_path(self, key: str) -> str:
         """Get the path of the file by calling its key.
@@ -194,29 +267,63 @@ class Data:
         :param key: Name of the basename file
         :return: The file's absolute path
         """
-        return self.files[key]
-
-    def _get_files(self, path: str) -> t.List[str]:
-        pathlist = []
-        if os.path.isfile(path):
-            pathlist.extend(self._parse_datafile(path))
-
-        return pathlist
+        return getattr(self.files, key.replace(".", "_"))
 
-    def _format_include(self, path: str) -> t.Tuple[str, ...]:
-        return tuple(self._get_files(path))
+    def _get_files(self, path: str) -> t.Iterator[str]:
+        return self._iter_entries(path) if os.path.isfile(path) else iter(())
 
     def get_include(self) -> t.Tuple[str, ...]:
         """Directories and files to include from the ``include`` file.
 
         :return: Tuple of paths to include in backups for that profile
         """
-        include_path = self.get_path(INCLUDE)
-        return self._format_include(include_path)
+        return tuple(self._get_files(self.files.include))
 
     @staticmethod
-    def _format_exclude(pathlist: t.List[str]) -> t.Tuple[str, ...]:
-        return tuple(f"--exclude {e}" for e in pathlist)
+    def _split_exclude(path: str) -> t.List[str] | None:
+        # patterns with a style prefix e.g. ``re:`` or ``sh:`` cannot be
+        # compared by their path segments
+        if _PATTERN_STYLE_RE.match(path):
+            return None
+
+        return path.rstrip("/").split("/")
+
+    @staticmethod
+    def _has_excluded_parent(
+        trie: t.Dict[str | None, t.Any], parts: t.List[str]
+    ) -> bool:
+        node = trie
+        for part in parts[:-1]:
+            node = node[part]
+            if None in node:
+                return True
+
+        return False
+
+    def _dedupe_exclude(self, pathlist: t.Iterable[str]) -> t.List[str]:
+        # borg excludes the contents of an excluded directory along with
+        # it, so drop any path which falls under another excluded path
+        trie: t.Dict[str | None, t.Any] = {}
+        split = [(p, self._split_exclude(p)) for p in pathlist]
+        for _, parts in split:
+            if parts is not None:
+                node = trie
+                for part in parts:
+                    node = node.setdefault(part, {})
+
+                node[None] = True
+
+        deduped = []
+        seen: t.Set[t.Any] = set()
+        for path, parts in split:
+            key = path if parts is None else tuple(parts)
+            if key not in seen and not (
+                parts is not None and self._has_excluded_parent(trie, parts)
+            ):
+                seen.add(key)
+                deduped.append(path)
+
+        return deduped
 
     def get_exclude(self) -> t.Tuple[str, ...]:
         """Return the values obtained from the ``exclude`` file.
@@ -224,29 +331,34 @@ class Data:
         Unlike the ``include`` file this doesn't necessarily need to
         be populated
 
-        Every item will automatically be prefixed with ``--exclude``
-        for the ``borgbackup`` commandline
+        Paths already excluded by an excluded parent directory are
+        dropped
 
         :return: A lit of paths to exclude - this will override items in
             ``include``
         """
-        exclude_path = self.get_path(EXCLUDE)
-        exclude_list = self._get_files(exclude_path)
-        return self._format_exclude(exclude_list)
+        return tuple(self._dedupe_exclude(self._get_files(self.files.exclude)))
 
 
 class PygmentPrint:
     """Instantiate with the path to the config file for syntax styles.
 
-    Class will read the file and maintain its config throughout the
-    process.
+    Class will read the file, when first needed, and maintain its
+    config throughout the process.
 
     :param styles: The path to the ``styles`` config file.
     """
 
     def __init__(self, styles: str) -> None:
         self.styles = styles
-        self.style = self.read_styles()
+
+    @functools.cached_property
+    def style(self) -> str:
+        """Style config read from the ``styles`` file.
+
+        :return: Style config.
+        """
+        return self.read_styles()
 
     def read_styles(self) -> str:
         """Read the ``styles`` file into the buffer.
@@ -256,15 +368,10 @@ class PygmentPrint:
         :return: Style config.
         """
         with open(self.styles, encoding="utf-8") as file:
-            contents = file.readlines()
-
-        for content in contents:
-            try:
-                if content[0] != "#":
-                    return content.split("=")[1].replace('"', "").strip()
-
-            except IndexError:
-                pass
+            for line in file:
+                match = _STYLE_RE.match(line)
+                if match:
+                    return match.group(1).strip()
 
         return "default"
 
@@ -279,8 +386,10 @@ class PygmentPrint:
             shell.
         """
         if string:
-            lexer = IniLexer if ini else BashLexer
+            # pylint: disable=import-outside-toplevel
+            from pygments import highlight
+
             string = highlight(
-                string, lexer(), Terminal256Formatter(style=self.style)
+                string, _get_lexer(ini), _get_formatter(self.style)
             )
             print(string)
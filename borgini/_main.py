@@ -6,13 +6,10 @@ Contains package entry point.
 """
 from __future__ import annotations
 
-import shutil
 import sys
 
 from . import funcs, parser
-from ._core import BorgBackup, Data, PygmentPrint
-
-__version__ = "1.0.0"
+from ._core import BorgBackup, Data, PygmentPrint, which
 
 
 class Parser(parser.RawParser):
@@ -34,7 +31,7 @@ class Parser(parser.RawParser):
     def _check_editor(self) -> str | None:
         # exit the process if the editor argument has been incorrectly
         # supplied
-        if not shutil.which(self.editor):
+        if not which(self.editor):
             return parser.getcolor(
                 f"EDITOR must be installed: `{self.editor}' cannot be found",
                 code=1,
@@ -66,13 +63,15 @@ def main() -> None:
     data = Data(funcs.CONFIGDIR, profile)
     data.make_appdir()
     funcs.initialize_datafiles(data)
-    pygments = PygmentPrint(data.files["styles"])
+    pygments = PygmentPrint(data.files.styles)
     catch = parser.Catch(profile)
-    _configpath = data.get_path("config.ini")
-    _config = funcs.initialize_config(_configpath, catch)
+    _configpath = data.files.config_ini
+    funcs.initialize_new_config(_configpath, catch)
+    # these exit before the config needs to be parsed
     funcs.remove_profile(args.remove)
     funcs.list_profiles(args.list, pygments)
     funcs.edit_file(args.editor, args.__dict__, data.files, pygments, dry)
+    _config = funcs.initialize_config(_configpath)
     funcs.set_passphrase(
         _config.get_key("ENVIRONMENT", "keyfile"), catch  # type: ignore
     )
@@ -7,14 +7,55 @@ All things ``config.ini``
 from __future__ import annotations
 
 import configparser
+import contextlib
 import getpass
+import io
+import json
 import os
 import socket
+import tempfile
 import typing as t
 
 NONE = "None"
 DEFAULT = "DEFAULT"
 
+_BOOLS = configparser.ConfigParser.BOOLEAN_STATES
+_RUNTIME = "<runtime>"
+_DEFAULTS: t.Dict[str, t.Dict[str, t.Any]] = {
+    DEFAULT: {
+        "reponame": _RUNTIME,
+        "repopath": NONE,
+        "timestamp": "%Y-%m-%dT%H:%M:%S",
+        "ssh": True,
+        "prune": True,
+    },
+    "SSH": {"remoteuser": _RUNTIME, "remotehost": _RUNTIME, "port": "22"},
+    "BACKUP": {
+        "verbose": True,
+        "stats": True,
+        "list": True,
+        "show-rc": True,
+        "exclude-caches": True,
+        "filter": "AME",
+        "compression": "lz4",
+    },
+    "PRUNE": {
+        "verbose": False,
+        "stats": True,
+        "list": True,
+        "show-rc": True,
+        "keep-daily": "7",
+        "keep-weekly": "4",
+        "keep-monthly": "6",
+    },
+    "ENVIRONMENT": {"keyfile": NONE},
+}
+_RUNTIME_VALUES: t.Tuple[t.Tuple[str, str, t.Callable[[], str]], ...] = (
+    (DEFAULT, "reponame", socket.gethostname),
+    ("SSH", "remoteuser", getpass.getuser),
+    ("SSH", "remotehost", socket.gethostname),
+)
+
 
 class RawConfig:
     """Contains the ``configparser.ConfigParser`` object.
@@ -32,54 +73,101 @@ class RawConfig:
 
     def __init__(self, configpath: str | os.PathLike) -> None:
         self.configpath = configpath
+        self.cachepath = f"{configpath}.cache.json"
         self.parser = configparser.ConfigParser(interpolation=None)
 
-    def _read_kwargs(self, **kwargs: t.Dict[str, t.Any]):
-        self.parser.read_dict(kwargs)
-
     def _load_default_values(self) -> None:
-        hostname = socket.gethostname()
-        user = getpass.getuser()
-        self._read_kwargs(
-            DEFAULT={
-                "reponame": hostname,
-                "repopath": NONE,
-                "timestamp": "%Y-%m-%dT%H:%M:%S",
-                "ssh": True,
-                "prune": True,
-            },
-            SSH={"remoteuser": user, "remotehost": hostname, "port": "22"},
-            BACKUP={
-                "verbose": True,
-                "stats": True,
-                "list": True,
-                "show-rc": True,
-                "exclude-caches": True,
-                "filter": "AME",
-                "compression": "lz4",
-            },
-            PRUNE={
-                "verbose": False,
-                "stats": True,
-                "list": True,
-                "show-rc": True,
-                "keep-daily": "7",
-                "keep-weekly": "4",
-                "keep-monthly": "6",
-            },
-            ENVIRONMENT={"keyfile": NONE},
-        )
+        self.parser.read_dict(_DEFAULTS)
+
+    def _load_runtime_values(self) -> None:
+        # only resolve the hostname and user if they have not been
+        # configured already
+        for section, key, func in _RUNTIME_VALUES:
+            if self.parser[section][key] == _RUNTIME:
+                self.parser[section][key] = func()
 
     def write_values(self) -> None:
-        """Write values from ``ConfigParser`` to the config file."""
+        """Write values from ``ConfigParser`` to the config file.
+
+        The file is left untouched if it already holds these values.
+        """
+        buffer = io.StringIO()
+        self.parser.write(buffer)
+        content = buffer.getvalue()
+        with contextlib.suppress(OSError), open(
+            self.configpath, encoding="utf-8"
+        ) as configfile:
+            if configfile.read() == content:
+                return
+
         with open(self.configpath, "w", encoding="utf-8") as configfile:
-            self.parser.write(configfile)
+            configfile.write(content)
 
     def write_new_config(self) -> None:
         """Load default values into the ``ConfigParser`` and write."""
         self._load_default_values()
+        self._load_runtime_values()
         self.write_values()
 
+    def _stat_config(self) -> t.Tuple[int, int]:
+        stat = os.stat(self.configpath)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_cache(self) -> bool:
+        # only reuse the snapshot if ``config.ini`` has not been touched
+        # since it was taken, and it was taken with the same defaults so
+        # new keys are still merged into existing configs
+        try:
+            with open(self.cachepath, encoding="utf-8") as file:
+                stat, defaults, values = json.load(file)
+                cached = os.fstat(file.fileno()).st_mtime_ns
+
+            # a snapshot taken within the same timestamp tick as the last
+            # change to ``config.ini`` may have missed a second change in
+            # that tick with the same size
+            if (
+                tuple(stat) != self._stat_config()
+                or cached <= stat[0]
+                or defaults != _DEFAULTS
+            ):
+                return False
+
+            self.parser.read_dict(values)
+
+        # a corrupt or foreign snapshot may not unpack into the expected
+        # values
+        except (OSError, ValueError, TypeError, AttributeError):
+            return False
+
+        return True
+
+    def _write_cache(self) -> None:
+        defaults = self.parser.defaults()
+        values = {
+            s: {
+                k: v
+                for k, v in self.parser.items(s, raw=True)
+                if s == DEFAULT or k not in defaults
+            }
+            for s in self.parser
+        }
+        # write to a temporary file of its own first so that a concurrent
+        # run never reads a partially written snapshot, and as the
+        # snapshot is optional do not fail the run if it cannot be written
+        with contextlib.suppress(OSError):
+            fd, tmp = tempfile.mkstemp(
+                suffix=".tmp", dir=os.path.dirname(self.cachepath)
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump([self._stat_config(), _DEFAULTS, values], file)
+
+                os.replace(tmp, self.cachepath)
+
+            except OSError:
+                os.remove(tmp)
+                raise
+
     def read(self) -> None:
         """Read the ``config.ini`` file and avoid non-critical errors.
 
@@ -90,22 +178,26 @@ class RawConfig:
         buffer, as it will be removed once the config is subsequently
         written. Any new keys and configurations that may be added in
         the future will also be safely added to the config.
+
+        The parsed result is cached alongside the ``config.ini`` file
+        and reused for as long as the ``config.ini`` file is unchanged.
         """
-        self._load_default_values()
-        reader = configparser.ConfigParser(interpolation=None)
-        reader.read(self.configpath)
-        for section in reader:
-            for key in dict(reader[section]):
-                if section == DEFAULT or (
-                    section != DEFAULT and key not in reader[DEFAULT]
-                ):
-                    try:
-                        self.parser[section][key] = reader[section][key]
-
-                    except KeyError:
-                        pass
+        if self._read_cache():
+            return
 
+        self._load_default_values()
+        self.parser.read(self.configpath, encoding="utf-8")
+        default_keys = frozenset(self.parser.defaults())
+        for section in self.parser.sections():
+            if section not in _DEFAULTS:
+                self.parser.remove_section(section)
+            else:
+                for key in default_keys:
+                    self.parser.remove_option(section, key)
+
+        self._load_runtime_values()
         self.write_values()
+        self._write_cache()
 
 
 class Proxy:
@@ -134,36 +226,6 @@ class Proxy:
         sections.append(DEFAULT)
         return sections
 
-    def _filter_default(self, section: str) -> t.Dict[str, t.Any]:
-        if section == DEFAULT:
-            return dict(self.parser[section])
-
-        return {
-            k: v
-            for k, v in self.parser[section].items()
-            if k not in dict(self.parser[DEFAULT])
-        }
-
-    def _raw_dict(self) -> t.Dict[str, t.Any]:
-        return {s: self._filter_default(s) for s in self.sections}
-
-    @staticmethod
-    def _convert_null(obj: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
-        return {s: {k: v for k, v in obj[s].items() if v != NONE} for s in obj}
-
-    def _get_boolean(self, section: str, key: str) -> bool:
-        try:
-            if key.startswith("keep-"):
-                raise ValueError
-
-            return self.parser.getboolean(section, key)
-
-        except ValueError:
-            return self._filter_default(section)[key]
-
-    def _convert_booleans(self, obj: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
-        return {s: {k: self._get_boolean(s, k) for k in obj[s]} for s in obj}
-
     @staticmethod
     def _filter_null(raw_dict: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
         return {k: v for k, v in raw_dict.items() if v}
@@ -173,10 +235,17 @@ class Proxy:
 
         :return: Dictionary object.
         """
-        raw_dict = self._raw_dict()
-        truthy = self._convert_null(raw_dict)
-        obj = self._convert_booleans(truthy)
-        return self._filter_null(obj)
+        default_keys = frozenset(self.parser.defaults())
+        return self._filter_null(
+            {
+                s: {
+                    k: v if k.startswith("keep-") else _BOOLS.get(v.lower(), v)
+                    for k, v in self.parser.items(s, raw=True)
+                    if v != NONE and (s == DEFAULT or k not in default_keys)
+                }
+                for s in self.sections
+            }
+        )
 
 
 class Config(Proxy):
@@ -192,9 +261,6 @@ class Config(Proxy):
         super().__init__(raw_config)
         self.dict = self.convert_proxy()
 
-    def _get_section(self, section: str) -> t.Dict[str, t.Any]:
-        return self.dict[section]
-
     def get_key(self, section: str, key: str) -> str | None:
         """Get a key from the dictionary object in ``self``.
 
@@ -208,11 +274,7 @@ class Config(Proxy):
         :param key: The key containing the configured value.
         :return: The value of the called key.
         """
-        try:
-            return self._get_section(section)[key]
-
-        except KeyError:
-            return None
+        return self.dict.get(section, {}).get(key)
 
     def get_keytuple(
         self, **kwargs: t.Tuple[str, ...]
@@ -225,21 +287,12 @@ class Config(Proxy):
         :param kwargs: Sections to get.
         :return: A tuple of multiple any one or more values.
         """
+        obj = self.dict
         return tuple(
-            self.get_key(s, k)
-            for s in kwargs  # pylint: disable=consider-using-dict-items
-            for k in kwargs[s]
+            obj.get(s, {}).get(k) for s, keys in kwargs.items() for k in keys
         )
 
-    @staticmethod
-    def _get_flags(obj: t.Dict[str, str]) -> t.List[str]:
-        return [f"--{k}" for k, v in obj.items() if v is True]
-
-    @staticmethod
-    def _get_keyvals(obj: t.Dict[str, str]) -> t.List[str]:
-        return [f"--{k} {v}" for k, v in obj.items() if isinstance(v, str)]
-
-    def return_all(self, section: str) -> t.Tuple[str, ...]:
+    def return_all(self, section: str) -> t.Tuple[t.Tuple[str, ...], ...]:
         """Get all args belonging to a section.
 
         The (kw)args that are boolean flags only need to exist, as their
@@ -251,9 +304,10 @@ class Config(Proxy):
         :param section: The section from which the (kw)args should be
             retrieved.
         :return: A tuple of all switches prefixed with ``"--"`` and all
-            kwargs.
+            kwargs, each as a tuple of its separate arguments.
         """
-        obj = self.dict[section]
-        args = self._get_flags(obj)
-        args.extend(self._get_keyvals(obj))
-        return tuple(args)
+        return tuple(
+            (f"--{k}",) if v is True else (f"--{k}", v)
+            for k, v in self.dict[section].items()
+            if v is True or isinstance(v, str)
+        )
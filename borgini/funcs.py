@@ -18,9 +18,84 @@ import sys
 import typing as t
 
 from . import config
-from ._core import HOME, Data, PygmentPrint
+from ._core import HOME, Data, Files, PygmentPrint
 from .parser import Catch
 
+_DRIVE_RE = re.compile(r"(^|/)([a-z]):")
+_NOTFILE = frozenset(("editor", "dry", "select", "list", "remove"))
+
+
+def _comment(filetype: str) -> str:
+    return (
+        f"# --- {filetype} ---\n"
+        "# This is an auto-generated list which should suite most users\n"
+        f"# Remove any entries you do not want to {filetype} and add any "
+        f"that you do\n"
+        "#\n"
+        "# . ensure you always use the absolute path for directories and "
+        "files\n"
+        "# . line and inline comments with `#' are supported\n"
+        "#"
+    )
+
+
+_PATHLISTS = (
+    (_comment("include"), "/home", "/root", "/var", "/usr/local", "/srv"),
+    (
+        _comment("exclude"),
+        "/home/*/.cache/*",
+        "/var/cache/*",
+        "/var/tmp/*",
+        "/var/run",
+    ),
+    (
+        "# --- styles ---",
+        "# Uncomment a single line to select style for syntax highlighting",
+        "# `pygments' must be installed to use this feature",
+        "#",
+        "# . Install pygments by running:",
+        "# . root:               `pip install pygments'",
+        "# . user (recommended): `pip install pygments --user'",
+        "#",
+        '# STYLE="default"',
+        '# STYLE="emacs"',
+        '# STYLE="friendly"',
+        '# STYLE="colorful"',
+        '# STYLE="autumn"',
+        '# STYLE="murphy"',
+        '# STYLE="manni"',
+        'STYLE="monokai"',
+        '# STYLE="perldoc"',
+        '# STYLE="pastie"',
+        '# STYLE="borland"',
+        '# STYLE="trac"',
+        '# STYLE="native"',
+        '# STYLE="fruity"',
+        '# STYLE="bw"',
+        '# STYLE="vim"',
+        '# STYLE="vs"',
+        '# STYLE="tango"',
+        '# STYLE="rrt"',
+        '# STYLE="xcode"',
+        '# STYLE="igor"',
+        '# STYLE="paraiso-light"',
+        '# STYLE="paraiso-dark"',
+        '# STYLE="lovelace"',
+        '# STYLE="algol"',
+        '# STYLE="algol_nu"',
+        '# STYLE="arduino"',
+        '# STYLE="rainbow_dash"',
+        '# STYLE="abap"',
+        '# STYLE="solarized-dark"',
+        '# STYLE="solarized-light"',
+        '# STYLE="sas"',
+        '# STYLE="stata"',
+        '# STYLE="stata-light"',
+        '# STYLE="stata-dark"',
+        '# STYLE="inkpot"',
+    ),
+)
+
 
 def get_configdir() -> str:
     """Get path to the config most suitable for active os and privilege.
@@ -40,23 +115,16 @@ def get_configdir() -> str:
 CONFIGDIR = get_configdir()
 
 
-def get_file_arg(
-    namespace: t.Dict[str, str], files: t.Dict[str, str]
-) -> str | None:
+def get_file_arg(namespace: t.Dict[str, str], files: Files) -> str | None:
     """Detect that a file has been selected to edit or view.
 
     :param namespace: The ``ArgumentParser`` ``Namespace.__dict__``.
-    :param files: The file's dictionary returned from ``data.Data``.
+    :param files: The file paths returned from ``data.Data``.
     :return: Return an absolute path or ``None``.
     """
-    notfile = "editor", "dry", "select", "list", "remove"
-    for key in namespace:
-        if key not in notfile and namespace[key]:
-            try:
-                return files[key]
-
-            except KeyError:
-                return files[f"{key}.ini"]
+    for key, val in namespace.items():
+        if val and key not in _NOTFILE:
+            return getattr(files, key, None) or getattr(files, f"{key}_ini")
 
     return None
 
@@ -68,10 +136,7 @@ def normalize_ntpath(path: str) -> str:
     :return: Returns a formatted path if running Windows otherwise the
         same path that came in.
     """
-    normalized = "/".join(
-        p[:-1] if re.match("^[a-zA-Z]:", p) else p
-        for p in [p.lower() for p in path.split("\\")]
-    )
+    normalized = _DRIVE_RE.sub(r"\1\2", path.lower().replace("\\", "/"))
     return normalized if path[0] == "/" else f"/{normalized}"
 
 
@@ -113,7 +178,7 @@ def read_file(filepath: str, pygments: PygmentPrint) -> None:
 def edit_file(
     editor: str,
     namespace: t.Dict[str, str],
-    files: t.Dict[str, str],
+    files: Files,
     pygments: PygmentPrint,
     dry: bool,
 ) -> None:
@@ -126,7 +191,7 @@ def edit_file(
     :param editor: The editor to edit the file with.
     :param namespace: ``argparse.ArgumentParser``'s
         ``Namespace.__dict__``.
-    :param files: Dictionary of config file paths.
+    :param files: Config file paths.
     :param pygments: Instantiated ``print.PygmentPrint`` class
         configured with user's style option.
     :param dry: Dry mode for when we do not want to execute the code.
@@ -166,6 +231,16 @@ def get_path(
     return f"ssh://{borguser}@{hostname}:{port}{repopath}" if ssh else repopath
 
 
+def read_keyfile(keyfile: str) -> str:
+    """Read the passphrase from a keyfile.
+
+    :param keyfile: The absolute path to the passphrase keyfile.
+    :return: The passphrase without surrounding whitespace.
+    """
+    with open(keyfile, encoding="utf-8") as file:
+        return file.read().strip()
+
+
 def set_passphrase(keyfile: str, catch: Catch) -> None:
     """Export the ``BORG_PASSPHRASE`` env var from a keyfile.
 
@@ -175,26 +250,29 @@ def set_passphrase(keyfile: str, catch: Catch) -> None:
     """
     if keyfile:
         if os.path.isfile(keyfile):
-            with open(keyfile, encoding="utf-8") as file:
-                passphrase = file.read().strip()
-
-            os.environ["BORG_PASSPHRASE"] = passphrase
+            os.environ["BORG_PASSPHRASE"] = read_keyfile(keyfile)
         else:
             catch.announce_keyfile()
 
 
-def initialize_config(configpath: str, catch: Catch) -> config.Config:
-    """If a config file does not exist create a default, else read.
+def initialize_new_config(configpath: str, catch: Catch) -> None:
+    """If a config file does not exist create a default and announce.
 
     :param configpath: Path to config file.
     :param catch: Instantiated ``Catch`` object.
-    :return: Instantiated ``ConfigParser`` object.
     """
-    raw_config = config.RawConfig(configpath)
     if not os.path.isfile(configpath):
-        raw_config.write_new_config()
+        config.RawConfig(configpath).write_new_config()
         catch.announce_first_run()
 
+
+def initialize_config(configpath: str) -> config.Config:
+    """Read the config file, which ``initialize_new_config`` created.
+
+    :param configpath: Path to config file.
+    :return: Instantiated ``ConfigParser`` object.
+    """
+    raw_config = config.RawConfig(configpath)
     raw_config.read()
     return config.Config(raw_config)
 
@@ -221,6 +299,16 @@ def remove_profile(remove: t.List[str]) -> None:
         sys.exit(0)
 
 
+def _get_profile_defaults(configpath: str) -> t.Dict[str, t.Any]:
+    # read through the cached config so the values listed are the same
+    # repaired and converted values the profile would run with
+    raw_config = config.RawConfig(configpath)
+    raw_config.read()
+    obj = config.Config(raw_config).dict[config.DEFAULT]
+    del obj["timestamp"]
+    return obj
+
+
 def list_profiles(show_profiles: t.List[str], pygments: PygmentPrint) -> None:
     """If ``show_profiles`` then display a list of profiles that exist.
 
@@ -229,26 +317,18 @@ def list_profiles(show_profiles: t.List[str], pygments: PygmentPrint) -> None:
         configured with user's style option.
     """
     if show_profiles:
-        profiles = list(os.listdir(CONFIGDIR))
-        profiles.insert(0, profiles.pop(profiles.index("default")))
-        for profile in profiles:
-            data = Data(CONFIGDIR, profile)
-            configpath = data.get_path("config.ini")
-            raw_config = config.RawConfig(configpath)
-            try:
-                raw_config.read()
-
-            except NotADirectoryError:
-                continue
-
-            _config = config.Config(raw_config)
-            obj = _config.dict["DEFAULT"]
-            del obj["timestamp"]
-            out = f"[{profile}]\n"
+        with os.scandir(CONFIGDIR) as entries:
+            profiles = [e for e in entries if e.is_dir()]
+
+        profiles.sort(key=lambda x: x.name != "default")
+        for entry in profiles:
+            obj = _get_profile_defaults(os.path.join(entry.path, "config.ini"))
+            out = f"[{entry.name}]\n"
             for key, val in obj.items():
                 out += f"{key} = {val}\n"
 
             pygments.print(out)
+
         sys.exit(0)
 
 
@@ -257,82 +337,4 @@ def initialize_datafiles(data: Data) -> None:
 
     :param data: ``data.Data``.
     """
-
-    def comment(filetype):
-        return (
-            f"# --- {filetype} ---\n"
-            "# This is an auto-generated list which should suite most users\n"
-            f"# Remove any entries you do not want to {filetype} and add any "
-            f"that you do\n"
-            "#\n"
-            "# . ensure you always use the absolute path for directories and "
-            "files\n"
-            "# . line and inline comments with `#' are supported\n"
-            "#"
-        )
-
-    pathlists = (
-        (
-            f"{comment('include')}",
-            "/home",
-            "/root",
-            "/var",
-            "/usr/local",
-            "/srv",
-        ),
-        (
-            f"{comment('exclude')}",
-            "/home/*/.cache/*",
-            "/var/cache/*",
-            "/var/tmp/*",
-            "/var/run",
-        ),
-        (
-            "# --- styles ---",
-            "# Uncomment a single line to select style for syntax "
-            "highlighting",
-            "# `pygments' must be installed to use this feature",
-            "#",
-            "# . Install pygments by running:",
-            "# . root:               `pip install pygments'",
-            "# . user (recommended): `pip install pygments --user'",
-            "#",
-            '# STYLE="default"',
-            '# STYLE="emacs"',
-            '# STYLE="friendly"',
-            '# STYLE="colorful"',
-            '# STYLE="autumn"',
-            '# STYLE="murphy"',
-            '# STYLE="manni"',
-            'STYLE="monokai"',
-            '# STYLE="perldoc"',
-            '# STYLE="pastie"',
-            '# STYLE="borland"',
-            '# STYLE="trac"',
-            '# STYLE="native"',
-            '# STYLE="fruity"',
-            '# STYLE="bw"',
-            '# STYLE="vim"',
-            '# STYLE="vs"',
-            '# STYLE="tango"',
-            '# STYLE="rrt"',
-            '# STYLE="xcode"',
-            '# STYLE="igor"',
-            '# STYLE="paraiso-light"',
-            '# STYLE="paraiso-dark"',
-            '# STYLE="lovelace"',
-            '# STYLE="algol"',
-            '# STYLE="algol_nu"',
-            '# STYLE="arduino"',
-            '# STYLE="rainbow_dash"',
-            '# STYLE="abap"',
-            '# STYLE="solarized-dark"',
-            '# STYLE="solarized-light"',
-            '# STYLE="sas"',
-            '# STYLE="stata"',
-            '# STYLE="stata-light"',
-            '# STYLE="stata-dark"',
-            '# STYLE="inkpot"',
-        ),
-    )
-    data.initialize_data_files(pathlists)
+    data.initialize_data_files(_PATHLISTS)
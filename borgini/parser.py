@@ -24,6 +24,9 @@ def getcolor(string: str, code: int) -> str:
     return f"\u001b[0;3{code};40m{string}\u001b[0;0m"
 
 
+_PROG = getcolor("borgini", 6)
+
+
 class RawParser(argparse.ArgumentParser):
     """Inherit ``ArgumentParser`` to be parsed from the commandline.
 
@@ -31,9 +34,10 @@ class RawParser(argparse.ArgumentParser):
     """
 
     def __init__(self) -> None:
+        self._fast_version_request()
         # noinspection PyTypeChecker
         super().__init__(
-            prog=getcolor("borgini", 6),
+            prog=_PROG,
             formatter_class=lambda prog: argparse.HelpFormatter(
                 prog, max_help_position=42
             ),
@@ -118,6 +122,15 @@ class RawParser(argparse.ArgumentParser):
             }
             self.arg_groups[group.title] = argparse.Namespace(**group_dict)
 
+    @staticmethod
+    def _fast_version_request() -> None:
+        # print version without building the parser if `--version` is
+        # the only argument passed to commandline, otherwise leave it to
+        # the parser so help and errors take precedence
+        if sys.argv[1:] in (["-v"], ["--version"]):
+            print(__version__)
+            sys.exit(0)
+
     def _version_request(self) -> None:
         # print version if `--version` is passed to commandline
         if self.args.version:
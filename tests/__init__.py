@@ -4,7 +4,6 @@ tests
 
 Test package for ``borgini``.
 """
-import datetime
 import getpass
 import os
 import re
@@ -30,6 +29,8 @@ DRY = "--dry"
 DEFAULT = "default"
 INITIALIZE_FILES = "initialize_files"
 TMPCONFIGDIR = "tmpconfigdir"
+FROZEN_TIME = "frozen_time"
+ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
 class NoColorCapsys:
@@ -60,8 +61,7 @@ class NoColorCapsys:
         :param out: String to strip of ANSI escape codes.
         :return: Same string but without ANSI codes.
         """
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", out)
+        return ANSI_ESCAPE.sub("", out)
 
     def readouterr(self) -> t.Tuple[str, ...]:
         """Call as capsys ``readouterr`` but regex the strings.
@@ -94,7 +94,7 @@ class BorgCommands:
     """
 
     def __init__(self, **kwargs):
-        self.datetime = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        self.datetime = DATETIME
         self.sections = self.get_sections(**kwargs)
         self.default = self.sections["DEFAULT"]
         self.ssh = self.sections["SSH"]
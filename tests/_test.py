@@ -4,33 +4,35 @@ tests._tests
 
 All tests for the package are in this module
 
-import flaky for flaky tests which involve the date-time in their
-output - there can be a slight skew when the date and time was set
-between the output and the _expected
+Tests which involve the date-time in their output freeze it with the
+``frozen_time`` fixture so there is no skew between the output and the
+_expected
 """
 from __future__ import annotations
 
-import configparser
+import json
 import os
+import typing as t
+from pathlib import Path
 from unittest import mock
 from unittest.mock import Mock
 
-import freezegun
 import pytest
 
 import borgini
 
 from . import (
+    BORG,
     CONFIG_INI,
     DATETIME,
     DEFAULT,
     DEVNULL,
     DRY,
+    FROZEN_TIME,
     INITIALIZE_FILES,
     NEWPROFILE,
     REPONAME,
     REPOPATH,
-    SHUTIL_WHICH,
     TMPCONFIGDIR,
     VIM,
     BorgCommands,
@@ -88,106 +90,124 @@ def test_empty_repo_setting(
     assert pytest_err.value.code == 1
 
 
-@freezegun.freeze_time(DATETIME)
-@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
+@pytest.mark.parametrize(
+    "default",
+    [{REPOPATH: DEVNULL}, {REPOPATH: DEVNULL, "ssh": False}],
+    ids=["ssh", "no-ssh"],
+)
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
 def test_borg_commands(
     main: MockMainFixture,
     update_config: UpdateConfigFixture,
     nocolorcapsys: NoColorCapsys,
-    tmpconfigdir: str,
+    configpath: str,
+    default: t.Dict[str, t.Any],
 ) -> None:
     """Test commands run with ``BorgBackup``.
 
     Test that values written to the config file yield the correct result
-    when running borgbackup commands.
+    when running borgbackup commands, and that the path is properly
+    adjusted to not include the full ssh path when ``ssh`` is False.
 
     :param main: Patch package entry point.
     :param update_config: Update the test config with parameters.
     :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
         codes.
-    :param tmpconfigdir:  Absolute path to directory containing
-        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    :param configpath: Path to the default profile's ``config.ini``.
+    :param default: Values to write to the ``DEFAULT`` section.
     """
-    configpath = os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
-    borg_commands = BorgCommands(
-        DEFAULT={REPONAME: expected.HOST, REPOPATH: DEVNULL},
-        SSH={
-            "remoteuser": expected.USER,
-            "remotehost": expected.HOST,
-            "port": "22",
-        },
-    )
+    borg_commands = BorgCommands(DEFAULT={REPONAME: expected.HOST, **default})
     _expected = borg_commands.commands()
-    update_config(configpath, DEFAULT={REPOPATH: DEVNULL})
+    update_config(configpath, DEFAULT=default)
     main(DRY)
     out = nocolorcapsys.stdout()
     assert out == _expected
 
 
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-def test_show_config(
-    main: MockMainFixture, nocolorcapsys: NoColorCapsys
+def test_list_symlinked_profile(
+    main: MockMainFixture,
+    list_arg: ListArgFixture,
+    initialize_profile: InitializeProfileFixture,
+    nocolorcapsys: NoColorCapsys,
+    tmpconfigdir: str,
 ) -> None:
-    """Test printing of config.
-
-    Test the correct stdout is displayed when running the ``--config``
-    flag without an editor to show the config.
+    """Test symlinked profiles are listed as they can be selected.
 
     :param main: Patch package entry point.
+    :param list_arg: Expected arg.
+    :param initialize_profile: Create a test profile.
     :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
         codes.
+    :param tmpconfigdir:  Absolute path to directory containing
+        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
     """
+    initialize_profile(main, tmpconfigdir, nocolorcapsys, NEWPROFILE)
+    os.rename(
+        os.path.join(tmpconfigdir, NEWPROFILE),
+        os.path.join(tmpconfigdir, "target"),
+    )
+    os.symlink("target", os.path.join(tmpconfigdir, NEWPROFILE))
     with pytest.raises(SystemExit):
-        main("--config")
-    out = nocolorcapsys.stdout()
-    assert out == expected.SHOW_CONFIG
+        main("--list")
+    assert list_arg(NEWPROFILE) in nocolorcapsys.stdout()
 
 
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-def test_show_include(
+def test_show_config(
     main: MockMainFixture, nocolorcapsys: NoColorCapsys
 ) -> None:
-    """Test printing of include config.
+    """Test printing of config.
 
-    Test the correct stdout is displayed when running the ``--include``
-    flag without an editor to show the include file.
+    Test the correct stdout is displayed when running the ``--config``
+    flag without an editor to show the config.
 
     :param main: Patch package entry point.
     :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
         codes.
     """
     with pytest.raises(SystemExit):
-        main("--include")
+        main("--config")
     out = nocolorcapsys.stdout()
-    assert out == expected.SHOW_INCLUDE
+    assert out == expected.SHOW_CONFIG
 
 
+@pytest.mark.parametrize(
+    "datafile,expects",
+    [("include", expected.SHOW_INCLUDE), ("exclude", expected.SHOW_EXCLUDE)],
+    ids=["include", "exclude"],
+)
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-def test_show_exclude(
-    main: MockMainFixture, nocolorcapsys: NoColorCapsys
+def test_show_datafile(
+    main: MockMainFixture,
+    nocolorcapsys: NoColorCapsys,
+    datafile: str,
+    expects: str,
 ) -> None:
-    """Test printing of exclude config.
+    """Test printing of the include and exclude lists.
 
-    Test the correct stdout is displayed when running the ``--exclude``
-    flag without an editor to show the exclude file.
+    Test the correct stdout is displayed when the ``--include`` or
+    ``--exclude`` flags are used without an editor.
 
     :param main: Patch package entry point.
     :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
         codes.
+    :param datafile: Name of the data file flag to read.
+    :param expects: Expected output.
     """
     with pytest.raises(SystemExit):
-        main("--exclude")
+        main(f"--{datafile}")
     out = nocolorcapsys.stdout()
-    assert out == expected.SHOW_EXCLUDE
+    assert out == expects
 
 
-@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
 def test_invalid_keyfile(  # pylint: disable=too-many-arguments
     main: MockMainFixture,
     invalid_keyfile: InvalidKeyfileFixture,
     update_config: UpdateConfigFixture,
     nocolorcapsys: NoColorCapsys,
-    tmpconfigdir: str,
+    configpath: str,
 ) -> None:
     """Test invalid keyfile.
 
@@ -199,10 +219,8 @@ def test_invalid_keyfile(  # pylint: disable=too-many-arguments
     :param update_config: Update the test config with parameters.
     :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
         codes.
-    :param tmpconfigdir: Absolute path to directory containing
-        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    :param configpath: Path to the default profile's ``config.ini``.
     """
-    configpath = os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
     _expected = invalid_keyfile(
         DEFAULT={REPONAME: expected.HOST, REPOPATH: DEVNULL},
         SSH={
@@ -221,14 +239,20 @@ def test_invalid_keyfile(  # pylint: disable=too-many-arguments
     assert out == _expected
 
 
+@pytest.mark.parametrize(
+    "args", [("--invalid",), (VIM, "--invalid")], ids=["show", "edit"]
+)
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
 def test_invalid_path_arg(
-    main: MockMainFixture, nocolorcapsys: NoColorCapsys
+    main: MockMainFixture,
+    nocolorcapsys: NoColorCapsys,
+    args: t.Tuple[str, ...],
 ) -> None:
     """Test execution with an invalid path argument.
 
     Test that the usage information is displayed when a file that does
-    not exist is entered and not the following:
+    not exist is entered, with or without the editor positional
+    argument, and not the following:
 
     - ``config``
     - ``include``
@@ -238,39 +262,14 @@ def test_invalid_path_arg(
     :param main: Patch package entry point.
     :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
         codes.
+    :param args: Commandline arguments to pass.
     """
     with pytest.raises(SystemExit):
-        main("--invalid")
+        main(*args)
     err = nocolorcapsys.stderr()
     assert err == expected.INVALID_PATH_ARG
 
 
-@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-def test_edit_invalid_path_arg(
-    main: MockMainFixture, nocolorcapsys: NoColorCapsys
-) -> None:
-    """Test execution when editor called to open invalid file.
-
-    Test that the usage information is displayed when a file that does
-    not exist is entered and not the following when running with the
-    editor positional argument:
-
-    - ``config``
-    - ``include``
-    - ``exclude``
-    - ``styles``
-
-    :param main: Patch package entry point.
-    :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
-        codes.
-    """
-    with pytest.raises(SystemExit):
-        main(VIM, "--invalid")
-    err = nocolorcapsys.stderr()
-    assert err == expected.INVALID_PATH_ARG
-
-
-@mock.patch(SHUTIL_WHICH)
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
 def test_edit_path_arg(
     mock_which: Mock,
@@ -304,14 +303,14 @@ def test_edit_path_arg(
     assert out == _expected
 
 
-@freezegun.freeze_time(DATETIME)
-@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
 def test_read_keyfile(  # pylint: disable=too-many-arguments
+    monkeypatch: pytest.MonkeyPatch,
     main: MockMainFixture,
     update_config: UpdateConfigFixture,
-    tmpdir: str | os.PathLike,
+    tmp_path: Path,
     capsys: pytest.CaptureFixture,
-    tmpconfigdir: str,
+    configpath: str,
     keygen: str,
 ) -> None:
     """Test loading of keyfile.
@@ -319,60 +318,30 @@ def test_read_keyfile(  # pylint: disable=too-many-arguments
     Test that the correct password is retrieved from a keyfile when the
     keyfile path is supplied in the config file.
 
+    :param monkeypatch: Mock patch environment and attributes.
     :param main: Patch package entry point.
     :param update_config: Update the test config with parameters.
-    :param tmpdir: Create and return temporary test directory.
+    :param tmp_path: Create and return temporary test directory.
     :param capsys: Silence stdout.
-    :param tmpconfigdir:  Absolute path to directory containing
-        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    :param configpath: Path to the default profile's ``config.ini``.
     :param keygen: Generate a keyfile and read its random password value
         to the ``BORG_PASSPHRASE`` environment variable.
     """
-    configpath = os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
-    keyfile = os.path.join(tmpdir, "borgsecret")
-    with open(keyfile, "w", encoding="utf-8") as file:
-        file.write(keygen)
+    keyfile = tmp_path / "borgsecret"
+    keyfile.write_text(f"{keygen}\n", encoding="utf-8")
+    assert borgini.funcs.read_keyfile(str(keyfile)) == keygen
+    # restore the environment once the passphrase has been exported
+    monkeypatch.delenv("BORG_PASSPHRASE", raising=False)
     update_config(
         configpath,
         DEFAULT={REPOPATH: DEVNULL},
-        ENVIRONMENT={"keyfile": keyfile},
+        ENVIRONMENT={"keyfile": str(keyfile)},
     )
     main(DRY)
     capsys.readouterr()
     assert os.environ["BORG_PASSPHRASE"] == keygen
 
 
-@freezegun.freeze_time(DATETIME)
-@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-def test_no_ssh(
-    main: MockMainFixture,
-    update_config: UpdateConfigFixture,
-    nocolorcapsys: NoColorCapsys,
-    tmpconfigdir: str,
-) -> None:
-    """Test execution when SSH is not meant to be used.
-
-    Test the path is properly adjusted to not include the full ssh path
-    when ``ssh`` is False.
-
-    :param main: Patch package entry point.
-    :param update_config: Update the test config with parameters.
-    :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
-        codes.
-    :param tmpconfigdir:  Absolute path to directory containing
-        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
-    """
-    configpath = os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
-    borg_commands = BorgCommands(
-        DEFAULT={REPONAME: expected.HOST, REPOPATH: DEVNULL, "ssh": False}
-    )
-    _expected = borg_commands.commands()
-    update_config(configpath, DEFAULT={REPOPATH: DEVNULL, "ssh": False})
-    main(DRY)
-    out = nocolorcapsys.stdout()
-    assert out == _expected
-
-
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
 def test_select_profile(
     main: MockMainFixture,
@@ -447,7 +416,6 @@ def test_remove_no_exist(
 
 
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-@pytest.mark.usefixtures()
 def test_remove_arg(
     main: MockMainFixture,
     remove: RemoveFixture,
@@ -475,48 +443,35 @@ def test_remove_arg(
     assert out == expected.REMOVE_ARG
 
 
-@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-def test_file_exists_error(
-    main: MockMainFixture,
-    initialize_profile: InitializeProfileFixture,
-    tmpconfigdir: str,
-    nocolorcapsys: NoColorCapsys,
-) -> None:
+def test_file_exists_error(tmpconfigdir: str) -> None:
     """Test error when a file already exists when initializing new one.
 
     Demonstrate that ``make_appdir`` should not be in
     ``borgini.data.Data.__init__``
 
-    :param main: Patch package entry point.
-    :param initialize_profile: Create a test profile.
     :param tmpconfigdir:  Absolute path to directory containing
         ``config.ini``, ``include``, ``exclude`` and ``styles``files.
-    :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
-        codes.
     """
-    initialize_profile(main, tmpconfigdir, nocolorcapsys, "profile1")
-    borgini.Data(tmpconfigdir, "profile1").make_appdir()
-    initialize_profile(main, tmpconfigdir, nocolorcapsys, "profile2")
-    borgini.Data(tmpconfigdir, "profile2").make_appdir()
-    with open(os.path.join(tmpconfigdir, "profile3"), "w", encoding="utf-8"):
-        # touch file
-        pass
+    for profile in ("profile1", "profile2"):
+        data = borgini.Data(tmpconfigdir, profile)
+        data.make_appdir()
+        # an existing profile directory is not an error
+        data.make_appdir()
+
+    Path(tmpconfigdir, "profile3").touch()
     with pytest.raises(FileExistsError):
         borgini.Data(tmpconfigdir, "profile3").make_appdir()
 
 
-@freezegun.freeze_time(DATETIME)
-@pytest.mark.parametrize("_", range(10))
-@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-def test_random_opts(  # pylint: disable=too-many-arguments
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
+def test_random_opts(
     main: MockMainFixture,
     randopts: RandOptsFixture,
     update_config: UpdateConfigFixture,
     nocolorcapsys: NoColorCapsys,
-    tmpconfigdir: str,
-    _: int,
+    configpath: str,
 ) -> None:
-    """Run this test function 10 times.
+    """Run this test 10 times against the same config directory.
 
     Random values will be generated and written to the config file
 
@@ -528,20 +483,17 @@ def test_random_opts(  # pylint: disable=too-many-arguments
     :param update_config: Update the test config with parameters.
     :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
         codes.
-    :param tmpconfigdir:  Absolute path to directory containing
-        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    :param configpath: Path to the default profile's ``config.ini``.
     """
-    configpath = os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
-    obj = randopts()
-    borg_commands = BorgCommands(**obj)
-    _expected = borg_commands.commands()
-    update_config(configpath, **obj)
-    main(DRY)
-    out = nocolorcapsys.stdout()
-    assert out == _expected
+    for _ in range(10):
+        obj = randopts()
+        borg_commands = BorgCommands(**obj)
+        _expected = borg_commands.commands()
+        update_config(configpath, **obj)
+        main(DRY)
+        assert nocolorcapsys.stdout() == _expected
 
 
-@mock.patch(SHUTIL_WHICH)
 def test_run_editor_without_arg(
     mock_which: Mock, main: MockMainFixture, nocolorcapsys: NoColorCapsys
 ) -> None:
@@ -563,7 +515,6 @@ def test_run_editor_without_arg(
     assert pytest_err.value.code == 1
 
 
-@mock.patch(SHUTIL_WHICH)
 def test_run_uninstalled_editor(
     mock_which: Mock, main: MockMainFixture, nocolorcapsys: NoColorCapsys
 ) -> None:
@@ -589,7 +540,7 @@ def test_run_uninstalled_editor(
 def test_repair_config_key_err(
     main: MockMainFixture,
     update_config: UpdateConfigFixture,
-    tmpconfigdir: str,
+    configpath: str,
     capsys: pytest.CaptureFixture,
 ) -> None:
     """Test repairing a config with a key error.
@@ -601,22 +552,21 @@ def test_repair_config_key_err(
 
     :param main: Patch package entry point.
     :param update_config: Update the test config with parameters.
-    :param tmpconfigdir:  Absolute path to directory containing
-        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    :param configpath: Path to the default profile's ``config.ini``.
     :param capsys: Silence stdout.
     """
     bad_section = "NOT_A_SECTION"
-    configpath = os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
     update_config(
         configpath,
         **{"DEFAULT": {REPOPATH: DEVNULL}, bad_section: {"bad_key": "null"}},
     )
     main(DRY)
     capsys.readouterr()  # silence
-    config = configparser.ConfigParser()
-    config.read(configpath)
-    with pytest.raises(KeyError):
-        _ = config[bad_section]
+    with open(configpath, encoding="utf-8") as file:
+        content = file.read()
+
+    assert f"[{bad_section}]" not in content
+    assert "bad_key" not in content
 
 
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
@@ -638,9 +588,7 @@ def test_pass_on_not_a_directory_err(
     :param capsys: Silence stdout.
     """
     out_of_place_file = os.path.join(tmpconfigdir, "out_of_place_file.txt")
-    with open(out_of_place_file, "w", encoding="utf-8"):
-        # create an empty file
-        pass
+    Path(out_of_place_file).touch()
     with pytest.raises(SystemExit):
         main("--list")
     capsys.readouterr()  # silence
@@ -673,21 +621,19 @@ def test_default_style(tmpconfigdir: str) -> None:
     """
     styles = os.path.join(tmpconfigdir, DEFAULT, "styles")
     with open(styles, encoding="utf-8") as file:
-        content = [r for r in file.readlines() if "monokai" not in r]
+        content = [r for r in file if "monokai" not in r]
     with open(styles, "w", encoding="utf-8") as file:
-        for line in content:
-            file.write(f"{line}\n")
+        file.writelines(content)
     pygments = borgini.PygmentPrint(styles)
     assert pygments.style == DEFAULT
 
 
 @pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
-@mock.patch("subprocess.call")
 def test_run_call_main_process(
     mock_subproc_call: Mock,
     main: MockMainFixture,
     update_config: UpdateConfigFixture,
-    tmpconfigdir: str,
+    configpath: str,
 ) -> None:
     """Test main.
 
@@ -697,22 +643,15 @@ def test_run_call_main_process(
     :param mock_subproc_call: Mock ``subprocess.call`` object.
     :param main: Patch package entry point.
     :param update_config: Update the test config with parameters.
-    :param tmpconfigdir:  Absolute path to directory containing
-        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    :param configpath: Path to the default profile's ``config.ini``.
     """
-    configpath = os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
     update_config(configpath, DEFAULT={REPOPATH: DEVNULL})
-    process_mock = mock.Mock()
-    attrs = {"wait.return_value": ("output", "error")}
-    process_mock.configure_mock(**attrs)
-    mock_subproc_call.return_value = process_mock
+    mock_subproc_call.return_value = 0
     main()
 
 
-@mock.patch(SHUTIL_WHICH)
-@mock.patch("subprocess.call")
 def test_run_call_editor(
-    mock_which: Mock, mock_subproc_call: Mock, main: MockMainFixture
+    mock_subproc_call: Mock, mock_which: Mock, main: MockMainFixture
 ) -> None:
     """Test running of called editor.
 
@@ -721,18 +660,17 @@ def test_run_call_editor(
 
     Mock ``vim`` for systems where ``vim`` isn't installed.
 
-    :param mock_which: Mock ``shutil.which`` object.
     :param mock_subproc_call: Mock ``subprocess.call`` object.
+    :param mock_which: Mock ``shutil.which`` object.
     :param main: Patch package entry point.
     """
-    process_mock = mock.Mock()
-    attrs = {"wait.return_value": ("output", "error")}
-    process_mock.configure_mock(**attrs)
-    mock_subproc_call.return_value = process_mock
-    mock_which.return_value = None
+    mock_subproc_call.return_value = 0
+    mock_which.return_value = VIM
     with pytest.raises(SystemExit):
         main(VIM, "--config")
 
+    assert mock_subproc_call.call_args.args[0][0] == VIM
+
 
 @pytest.mark.parametrize(
     "uid,expects",
@@ -779,10 +717,14 @@ def test_windows_attr_error(monkeypatch: pytest.MonkeyPatch) -> None:
     assert str(err.value) == "Windows not currently supported"
 
 
+@pytest.mark.parametrize(
+    "arg", ["--version", "-dv"], ids=["version", "combined-flags"]
+)
 def test_print_version(
     monkeypatch: pytest.MonkeyPatch,
     main: MockMainFixture,
     nocolorcapsys: NoColorCapsys,
+    arg: str,
 ) -> None:
     """Test printing of version on commandline.
 
@@ -790,9 +732,403 @@ def test_print_version(
     :param main: Patch package entry point.
     :param nocolorcapsys: Capture system output while stripping ANSI
         color codes.
+    :param arg: Argument requesting the version.
     """
     monkeypatch.setattr("borgini.parser.__version__", "1.0.0")
     with pytest.raises(SystemExit):
-        main("--version")
+        main(arg)
 
     assert nocolorcapsys.stdout().strip() == "1.0.0"
+
+
+@pytest.mark.parametrize(
+    "args,code",
+    [(("-h", "-v"), 0), (("--bogus", "-v"), 2)],
+    ids=["help", "invalid"],
+)
+def test_version_with_other_args(
+    monkeypatch: pytest.MonkeyPatch,
+    main: MockMainFixture,
+    nocolorcapsys: NoColorCapsys,
+    args: t.Tuple[str, ...],
+    code: int,
+) -> None:
+    """Test help and errors take precedence over printing the version.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param main: Patch package entry point.
+    :param nocolorcapsys: Capture system output while stripping ANSI
+        color codes.
+    :param args: Arguments passed alongside the version request.
+    :param code: Expected exit code.
+    """
+    monkeypatch.setattr("borgini.parser.__version__", "1.0.0")
+    with pytest.raises(SystemExit) as err:
+        main(*args)
+
+    assert err.value.code == code
+    assert "1.0.0" not in nocolorcapsys.stdout()
+
+
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
+def test_config_cache(
+    main: MockMainFixture,
+    update_config: UpdateConfigFixture,
+    nocolorcapsys: NoColorCapsys,
+    configpath: str,
+) -> None:
+    """Test the parsed config is cached until ``config.ini`` changes.
+
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
+        codes.
+    :param configpath: Path to the default profile's ``config.ini``.
+    """
+    update_config(configpath, DEFAULT={REPOPATH: DEVNULL})
+    os.utime(configpath, ns=(0, 0))
+    main(DRY)
+    first = nocolorcapsys.stdout()
+    assert os.path.isfile(f"{configpath}.cache.json")
+    main(DRY)
+    assert nocolorcapsys.stdout() == first
+    update_config(configpath, DEFAULT={REPOPATH: DEVNULL, "ssh": False})
+    main(DRY)
+    _expected = BorgCommands(
+        DEFAULT={REPONAME: expected.HOST, REPOPATH: DEVNULL, "ssh": False}
+    ).commands()
+    assert nocolorcapsys.stdout() == _expected
+
+
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
+def test_config_cache_corrupt(
+    main: MockMainFixture,
+    update_config: UpdateConfigFixture,
+    nocolorcapsys: NoColorCapsys,
+    configpath: str,
+) -> None:
+    """Test a corrupt config cache is ignored and the config reparsed.
+
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
+        codes.
+    :param configpath: Path to the default profile's ``config.ini``.
+    """
+    update_config(configpath, DEFAULT={REPOPATH: DEVNULL})
+    os.utime(configpath, ns=(0, 0))
+    main(DRY)
+    first = nocolorcapsys.stdout()
+    defaults = borgini.config._DEFAULTS  # pylint: disable=protected-access
+    size = os.stat(configpath).st_size
+    for snapshot in ("{", "[1, 2, 3]", json.dumps([[0, size], defaults, 0])):
+        Path(f"{configpath}.cache.json").write_text(snapshot, encoding="utf-8")
+        main(DRY)
+        assert nocolorcapsys.stdout() == first
+
+
+@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
+def test_config_cache_write_error(
+    monkeypatch: pytest.MonkeyPatch,
+    main: MockMainFixture,
+    update_config: UpdateConfigFixture,
+    configpath: str,
+) -> None:
+    """Test failing to write the config cache does not fail the run.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param configpath: Path to the default profile's ``config.ini``.
+    """
+    update_config(configpath, DEFAULT={REPOPATH: DEVNULL})
+    monkeypatch.setattr("borgini.config.os.replace", Mock(side_effect=OSError))
+    main(DRY)
+    dirname = os.path.dirname(configpath)
+    assert not [
+        p for p in os.listdir(dirname) if p.endswith((".tmp", ".json"))
+    ]
+
+
+@pytest.mark.usefixtures(INITIALIZE_FILES)
+def test_config_cache_new_defaults(
+    monkeypatch: pytest.MonkeyPatch,
+    main: MockMainFixture,
+    update_config: UpdateConfigFixture,
+    configpath: str,
+) -> None:
+    """Test keys added to the defaults are merged into a cached config.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param configpath: Path to the default profile's ``config.ini``.
+    """
+    update_config(configpath, DEFAULT={REPOPATH: DEVNULL})
+    os.utime(configpath, ns=(0, 0))
+    main(DRY)
+    assert os.path.isfile(f"{configpath}.cache.json")
+    monkeypatch.setitem(
+        borgini.config._DEFAULTS["BACKUP"],  # pylint: disable=protected-access
+        "one-file-system",
+        True,
+    )
+    raw_config = borgini.config.RawConfig(configpath)
+    raw_config.read()
+    assert raw_config.parser["BACKUP"]["one-file-system"] == "True"
+
+
+@pytest.mark.usefixtures(INITIALIZE_FILES)
+def test_config_unchanged_not_rewritten(
+    main: MockMainFixture, update_config: UpdateConfigFixture, configpath: str
+) -> None:
+    """Test ``config.ini`` is only rewritten if its content changes.
+
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param configpath: Path to the default profile's ``config.ini``.
+    """
+    update_config(configpath, DEFAULT={REPOPATH: DEVNULL})
+    main(DRY)
+    os.remove(f"{configpath}.cache.json")
+    os.utime(configpath, ns=(0, 0))
+    main(DRY)
+    assert os.stat(configpath).st_mtime_ns == 0
+
+
+def test_parse_datafile_blank_lines(tmpdir: str | os.PathLike) -> None:
+    """Test blank lines and indented comments are skipped.
+
+    :param tmpdir: Create and return temporary directory.
+    """
+    data = borgini.Data(str(tmpdir), DEFAULT)
+    data.make_appdir()
+    with open(data.get_path("include"), "w", encoding="utf-8") as file:
+        file.write("# comment\n/home  # inline\n\n   # indented\n/root\n")
+
+    assert data.get_include() == ("/home", "/root")
+
+
+def test_dedupe_exclude(tmpdir: str | os.PathLike) -> None:
+    """Test paths already excluded by a parent directory are dropped.
+
+    :param tmpdir: Create and return temporary directory.
+    """
+    data = borgini.Data(str(tmpdir), DEFAULT)
+    data.make_appdir()
+    with open(data.get_path("exclude"), "w", encoding="utf-8") as file:
+        file.write(
+            "/var/cache/apt\n/var/cache/\n/var/cache\n/var/tmp/*\n"
+            "/home/*/.cache\nre:^/var/cache/x\n/var/cachex\n"
+        )
+
+    assert data.get_exclude() == (
+        "/var/cache/",
+        "/var/tmp/*",
+        "/home/*/.cache",
+        "re:^/var/cache/x",
+        "/var/cachex",
+    )
+
+
+@pytest.mark.usefixtures(TMPCONFIGDIR, INITIALIZE_FILES)
+def test_list_arg_config_changes(  # pylint: disable=too-many-arguments
+    main: MockMainFixture,
+    list_arg: ListArgFixture,
+    initialize_profile: InitializeProfileFixture,
+    update_config: UpdateConfigFixture,
+    nocolorcapsys: NoColorCapsys,
+    tmpconfigdir: str,
+) -> None:
+    """Test listed profiles follow changes to ``config.ini``.
+
+    :param main: Patch package entry point.
+    :param list_arg: Expected arg.
+    :param initialize_profile: Create a test profile.
+    :param update_config: Update the test config with parameters.
+    :param nocolorcapsys: Capture stdout and strip it of any ANSI escape
+        codes.
+    :param tmpconfigdir:  Absolute path to directory containing
+        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    """
+    _expected = list_arg(DEFAULT, NEWPROFILE)
+    initialize_profile(main, tmpconfigdir, nocolorcapsys, NEWPROFILE)
+    with pytest.raises(SystemExit):
+        main("--list")
+    assert nocolorcapsys.stdout() == _expected
+    configpath = os.path.join(tmpconfigdir, NEWPROFILE, CONFIG_INI)
+    update_config(configpath, DEFAULT={"prune": False})
+    with pytest.raises(SystemExit):
+        main("--list")
+    assert nocolorcapsys.stdout() == (
+        f"{list_arg(DEFAULT)}[{NEWPROFILE}]\n"
+        f"reponame = {expected.HOST}\n"
+        "ssh = True\n"
+        "prune = False\n\n"
+    )
+    os.remove(configpath)
+    with pytest.raises(SystemExit):
+        main("--list")
+    assert nocolorcapsys.stdout() == _expected
+
+
+def test_timestamp_microseconds() -> None:
+    """Test the archive timestamp supports the ``%f`` directive."""
+    borg = borgini._core.BorgBackup(  # pylint: disable=protected-access
+        DEVNULL, borgini.PygmentPrint(DEVNULL), True, REPONAME, "%f"
+    )
+    assert borg.date.isdigit()
+
+
+@pytest.mark.parametrize(
+    "path,expects",
+    [
+        ("C:\\Users\\Foo\\config.ini", "/c/users/foo/config.ini"),
+        ("/home/foo/config.ini", "/home/foo/config.ini"),
+    ],
+    ids=["nt", "posix"],
+)
+def test_normalize_ntpath(path: str, expects: str) -> None:
+    """Test NT paths are formatted as Unix-like paths.
+
+    :param path: Path to format.
+    :param expects: Expected path.
+    """
+    assert borgini.funcs.normalize_ntpath(path) == expects
+
+
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
+def test_run_borg_argv(
+    mock_subproc_call: Mock,
+    mock_which: Mock,
+    main: MockMainFixture,
+    update_config: UpdateConfigFixture,
+    configpath: str,
+) -> None:
+    """Test ``borg`` is called with each argument as its own item.
+
+    :param mock_subproc_call: Mock ``subprocess.call`` object.
+    :param mock_which: Mock ``shutil.which`` object.
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param configpath: Path to the default profile's ``config.ini``.
+    """
+    mock_which.return_value = BORG
+    update_config(configpath, DEFAULT={REPOPATH: DEVNULL, "ssh": False})
+    main()
+    repo = f"{DEVNULL}/{expected.HOST}"
+    assert mock_subproc_call.call_args_list == [
+        mock.call(
+            [
+                BORG,
+                "create",
+                "--verbose",
+                "--stats",
+                "--list",
+                "--show-rc",
+                "--exclude-caches",
+                "--filter",
+                "AME",
+                "--compression",
+                "lz4",
+                "--exclude",
+                "/home/*/.cache/*",
+                "--exclude",
+                "/var/cache/*",
+                "--exclude",
+                "/var/tmp/*",
+                "--exclude",
+                "/var/run",
+                f"{repo}::{expected.HOST}-{DATETIME}",
+                "/home",
+                "/root",
+                "/var",
+                "/usr/local",
+                "/srv",
+            ]
+        ),
+        mock.call(
+            [
+                BORG,
+                "prune",
+                "--stats",
+                "--list",
+                "--show-rc",
+                repo,
+                "--keep-daily",
+                "7",
+                "--keep-weekly",
+                "4",
+                "--keep-monthly",
+                "6",
+            ]
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "path", ["/mnt/My Backups", "/home/o'brien"], ids=["space", "quote"]
+)
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
+def test_run_borg_argv_paths(  # pylint: disable=too-many-arguments
+    mock_subproc_call: Mock,
+    mock_which: Mock,
+    main: MockMainFixture,
+    update_config: UpdateConfigFixture,
+    configpath: str,
+    path: str,
+) -> None:
+    """Test paths with spaces or quotes are passed to ``borg`` whole.
+
+    :param mock_subproc_call: Mock ``subprocess.call`` object.
+    :param mock_which: Mock ``shutil.which`` object.
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param configpath: Path to the default profile's ``config.ini``.
+    :param path: Path containing characters a shell would split on.
+    """
+    mock_which.return_value = BORG
+    update_config(
+        configpath, DEFAULT={REPOPATH: path, "ssh": False, "prune": False}
+    )
+    dirname = os.path.dirname(configpath)
+    Path(dirname, "include").write_text(f"{path}\n", encoding="utf-8")
+    Path(dirname, "exclude").write_text(f"{path}/tmp\n", encoding="utf-8")
+    main()
+    argv = mock_subproc_call.call_args.args[0]
+    assert argv[-3:] == [
+        f"{path}/tmp",
+        f"{path}/{expected.HOST}::{expected.HOST}-{DATETIME}",
+        path,
+    ]
+    assert argv[-4] == "--exclude"
+
+
+@pytest.mark.usefixtures(FROZEN_TIME, TMPCONFIGDIR, INITIALIZE_FILES)
+def test_run_borg_keep_unlisted(
+    mock_subproc_call: Mock,
+    mock_which: Mock,
+    main: MockMainFixture,
+    update_config: UpdateConfigFixture,
+    configpath: str,
+) -> None:
+    """Test any ``keep-*`` option is passed to ``borg prune`` with value.
+
+    :param mock_subproc_call: Mock ``subprocess.call`` object.
+    :param mock_which: Mock ``shutil.which`` object.
+    :param main: Patch package entry point.
+    :param update_config: Update the test config with parameters.
+    :param configpath: Path to the default profile's ``config.ini``.
+    """
+    mock_which.return_value = BORG
+    update_config(
+        configpath,
+        DEFAULT={REPOPATH: DEVNULL, "ssh": False},
+        PRUNE={"keep-3monthly": "1"},
+    )
+    main()
+    argv = mock_subproc_call.call_args.args[0]
+    assert argv[-2:] == ["--keep-3monthly", "1"]
+    assert argv.index(f"{DEVNULL}/{expected.HOST}") < argv.index(
+        "--keep-daily"
+    )
@@ -5,24 +5,31 @@ tests.conftest
 from __future__ import annotations
 
 import configparser
+import datetime
 import os
 import random
 import secrets
 import string
 import sys
 import typing as t
+from unittest.mock import Mock
 
 import pytest
 
 import borgini
 
 from . import (
+    CONFIG_INI,
+    DATETIME,
+    DEFAULT,
     DEVNULL,
     DRY,
+    FROZEN_TIME,
     HOST,
     INITIALIZE_FILES,
     NEWPROFILE,
     REPOPATH,
+    SHUTIL_WHICH,
     TMPCONFIGDIR,
     BorgCommands,
     EditPathArgFixture,
@@ -38,6 +45,35 @@ from . import (
     UpdateConfigFixture,
 )
 
+FILTER_KWARGS = (
+    "A",
+    "M",
+    "U",
+    "E",
+    "d",
+    "b",
+    "c",
+    "h",
+    "s",
+    "f",
+    "i",
+    "-",
+    "x",
+    "?",
+)
+COMPRESSION_KWARGS = ("lz4", "zstd", "zlib", "lzma", "auto")
+DAILY = tuple(str(i) for i in range(1, 8))
+WEEKLY = tuple(str(i) for i in range(1, 5))
+MONTHLY = tuple(str(i) for i in range(1, 13))
+INVALID_KEYFILE_ANNOUNCE = (
+    "BORG_PASSPHRASE keyfile cannot be found\n"
+    "attempting backup without keyfile\n\n"
+    'add a valid keyfile or "None" to BORG_PASSPHRASE to stop '
+    "receiving this message\n"
+    "You can do this by running the command:\n"
+    " . borgini EDITOR --config --select default\n\n"
+)
+
 
 @pytest.fixture(name="homedir", autouse=True)
 def fixture_homedir(tmpdir: str | os.PathLike) -> None:
@@ -48,6 +84,46 @@ def fixture_homedir(tmpdir: str | os.PathLike) -> None:
     borgini.HOME = str(tmpdir)
 
 
+@pytest.fixture(name="clear_which", autouse=True)
+def fixture_clear_which() -> None:
+    """Clear cached ``shutil.which`` results so mocks are respected."""
+    borgini._core.which.cache_clear()  # pylint: disable=protected-access
+
+
+@pytest.fixture(name=FROZEN_TIME)
+def fixture_frozen_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Freeze the local time that archives are named with.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    """
+    frozen = datetime.datetime.strptime(DATETIME, "%Y-%m-%dT%H:%M:%S")
+    monkeypatch.setattr("borgini._core._now", lambda: frozen)
+
+
+@pytest.fixture(name="mock_which")
+def fixture_mock_which(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Mock ``shutil.which`` for the duration of the test.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :return: Mock ``shutil.which`` object.
+    """
+    mock_which = Mock()
+    monkeypatch.setattr(SHUTIL_WHICH, mock_which)
+    return mock_which
+
+
+@pytest.fixture(name="mock_subproc_call")
+def fixture_mock_subproc_call(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Mock ``subprocess.call`` for the duration of the test.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :return: Mock ``subprocess.call`` object.
+    """
+    mock_subproc_call = Mock()
+    monkeypatch.setattr("subprocess.call", mock_subproc_call)
+    return mock_subproc_call
+
+
 @pytest.fixture(name="main")
 def fixture_main(monkeypatch: pytest.MonkeyPatch) -> MockMainFixture:
     """Pass patched commandline arguments to package's main function.
@@ -103,11 +179,22 @@ def fixture_tmpconfigdir(tmpdir: str | os.PathLike) -> str:
     :return: Path to the random directory.
     """
     configdir = os.path.join(tmpdir, "borgini")
-    os.makedirs(configdir)
+    os.mkdir(configdir)
     borgini.funcs.CONFIGDIR = configdir
     return str(configdir)
 
 
+@pytest.fixture(name="configpath")
+def fixture_configpath(tmpconfigdir: str) -> str:
+    """Return the path to the default profile's ``config.ini``.
+
+    :param tmpconfigdir: Absolute path to directory containing
+        ``config.ini``, ``include``, ``exclude`` and ``styles``files.
+    :return: Path to the ``config.ini`` file.
+    """
+    return os.path.join(tmpconfigdir, DEFAULT, CONFIG_INI)
+
+
 @pytest.fixture(name="nocolorcapsys")
 def fixture_nocolorcapsys(capsys: pytest.CaptureFixture) -> NoColorCapsys:
     """Instantiate capsys with the regex method.
@@ -184,46 +271,15 @@ def fixture_randopts() -> RandOptsFixture:
     """
 
     def _randopts() -> RandOpts:
-        filterkwargs = [
-            "A",
-            "M",
-            "U",
-            "E",
-            "d",
-            "b",
-            "c",
-            "h",
-            "s",
-            "f",
-            "i",
-            "-",
-            "x",
-            "?",
-        ]
-        compressionkwargs = ["lz4", "zstd", "zlib", "lzma", "auto"]
-        daily = ["1", "2", "3", "4", "5", "6", "7"]
-        weekly = ["1", "2", "3", "4"]
-        monthly = [
-            "1",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "10",
-            "11",
-            "12",
-        ]
         randfkwargs = "".join(
-            random.sample(filterkwargs, random.randrange(1, len(filterkwargs)))
+            random.sample(
+                FILTER_KWARGS, random.randrange(1, len(FILTER_KWARGS))
+            )
         )
-        randckwargs = random.choice(compressionkwargs)
-        randdaily = random.choice(daily)
-        randweekly = random.choice(weekly)
-        randmonthly = random.choice(monthly)
+        randckwargs = random.choice(COMPRESSION_KWARGS)
+        randdaily = random.choice(DAILY)
+        randweekly = random.choice(WEEKLY)
+        randmonthly = random.choice(MONTHLY)
         return {
             "DEFAULT": {REPOPATH: DEVNULL},
             "SSH": {"port": random.randint(1, 9999)},
@@ -250,7 +306,7 @@ def fixture_randopts() -> RandOptsFixture:
     return _randopts
 
 
-@pytest.fixture(name="invalid_keyfile")
+@pytest.fixture(name="invalid_keyfile", scope="session")
 def fixture_invalid_keyfile() -> InvalidKeyfileFixture:
     """Create an invalid keyfile.
 
@@ -261,22 +317,12 @@ def fixture_invalid_keyfile() -> InvalidKeyfileFixture:
     """
 
     def _invalid_keyfile(**kwargs: t.Any) -> str:
-        announce = (
-            "BORG_PASSPHRASE keyfile cannot be found\n"
-            "attempting backup without keyfile\n\n"
-            'add a valid keyfile or "None" to BORG_PASSPHRASE to stop '
-            "receiving this message\n"
-            "You can do this by running the command:\n"
-            " . borgini EDITOR --config --select default\n\n"
-        )
-        borg_commands = BorgCommands(**kwargs)
-        command_output = borg_commands.commands()
-        return announce + command_output
+        return INVALID_KEYFILE_ANNOUNCE + BorgCommands(**kwargs).commands()
 
     return _invalid_keyfile
 
 
-@pytest.fixture(name="list_arg")
+@pytest.fixture(name="list_arg", scope="session")
 def fixture_list_arg() -> ListArgFixture:
     """Test for the correct stdout.
 
@@ -286,20 +332,15 @@ def fixture_list_arg() -> ListArgFixture:
     """
 
     def list_arg(*profiles: str) -> str:
-        _string = ""
-        for profile in profiles:
-            _string += (
-                f"[{profile}]\n"
-                f"reponame = {HOST}\n"
-                "ssh = True\n"
-                "prune = True\n\n"
-            )
-        return _string
+        return "".join(
+            f"[{profile}]\nreponame = {HOST}\nssh = True\nprune = True\n\n"
+            for profile in profiles
+        )
 
     return list_arg
 
 
-@pytest.fixture(name="initialize_files_expected")
+@pytest.fixture(name="initialize_files_expected", scope="session")
 def fixture_initialize_files_expected() -> InitializeFilesExpectedFixture:
     """Output that matches with stdout when initializing profile.
 
@@ -322,7 +363,7 @@ def fixture_initialize_files_expected() -> InitializeFilesExpectedFixture:
     return _initialize_files_expected
 
 
-@pytest.fixture(name="edit_path_arg")
+@pytest.fixture(name="edit_path_arg", scope="session")
 def fixture_edit_path_arg() -> EditPathArgFixture:
     """String to replace actual calling of an editor.
 
@@ -1,20 +1,28 @@
-_.return_value  # unused attribute (tests/_test.py:297)
-_.return_value  # unused attribute (tests/_test.py:558)
-_.return_value  # unused attribute (tests/_test.py:580)
-_.return_value  # unused attribute (tests/_test.py:708)
-_.return_value  # unused attribute (tests/_test.py:731)
-_.return_value  # unused attribute (tests/_test.py:732)
-fixture_edit_path_arg  # unused function (tests/conftest.py:325)
-fixture_homedir  # unused function (tests/conftest.py:42)
-fixture_initialize_files  # unused function (tests/conftest.py:67)
-fixture_initialize_files_expected  # unused function (tests/conftest.py:302)
-fixture_initialize_profile  # unused function (tests/conftest.py:138)
-fixture_invalid_keyfile  # unused function (tests/conftest.py:253)
-fixture_keygen  # unused function (tests/conftest.py:88)
-fixture_list_arg  # unused function (tests/conftest.py:279)
-fixture_main  # unused function (tests/conftest.py:51)
-fixture_nocolorcapsys  # unused function (tests/conftest.py:111)
-fixture_randopts  # unused function (tests/conftest.py:179)
-fixture_remove  # unused function (tests/conftest.py:163)
-fixture_tmpconfigdir  # unused function (tests/conftest.py:98)
-fixture_update_config  # unused function (tests/conftest.py:121)
+_.return_value  # unused attribute (tests/_test.py:1016)
+_.return_value  # unused attribute (tests/_test.py:1090)
+_.return_value  # unused attribute (tests/_test.py:1123)
+_.return_value  # unused attribute (tests/_test.py:296)
+_.return_value  # unused attribute (tests/_test.py:510)
+_.return_value  # unused attribute (tests/_test.py:531)
+_.return_value  # unused attribute (tests/_test.py:649)
+_.return_value  # unused attribute (tests/_test.py:667)
+_.return_value  # unused attribute (tests/_test.py:668)
+fixture_clear_which  # unused function (tests/conftest.py:87)
+fixture_configpath  # unused function (tests/conftest.py:187)
+fixture_edit_path_arg  # unused function (tests/conftest.py:366)
+fixture_frozen_time  # unused function (tests/conftest.py:93)
+fixture_homedir  # unused function (tests/conftest.py:78)
+fixture_initialize_files  # unused function (tests/conftest.py:143)
+fixture_initialize_files_expected  # unused function (tests/conftest.py:343)
+fixture_initialize_profile  # unused function (tests/conftest.py:225)
+fixture_invalid_keyfile  # unused function (tests/conftest.py:309)
+fixture_keygen  # unused function (tests/conftest.py:164)
+fixture_list_arg  # unused function (tests/conftest.py:325)
+fixture_main  # unused function (tests/conftest.py:127)
+fixture_mock_subproc_call  # unused function (tests/conftest.py:115)
+fixture_mock_which  # unused function (tests/conftest.py:103)
+fixture_nocolorcapsys  # unused function (tests/conftest.py:198)
+fixture_randopts  # unused function (tests/conftest.py:266)
+fixture_remove  # unused function (tests/conftest.py:250)
+fixture_tmpconfigdir  # unused function (tests/conftest.py:174)
+fixture_update_config  # unused function (tests/conftest.py:208)